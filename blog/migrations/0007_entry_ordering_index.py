@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_comment_entry_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='entry',
+            options={'ordering': ['-created_at', '-id'], 'verbose_name_plural': 'entries'},
+        ),
+        migrations.AlterIndexTogether(
+            name='entry',
+            index_together=set([('created_at', 'id')]),
+        ),
+    ]
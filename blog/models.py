@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.urlresolvers import reverse
-from django.template.defaultfilters import slugify
+from django.utils.functional import cached_property
+from django.utils.text import slugify
 
 import hashlib
 
@@ -17,6 +18,8 @@ class Entry(models.Model):
 
     class Meta:
     	verbose_name_plural = "entries"
+    	ordering = ['-created_at', '-id']
+    	index_together = [('created_at', 'id')]
 
     def get_absolute_url(self):
         kwargs = {'year' : self.created_at.year,
@@ -26,23 +29,36 @@ class Entry(models.Model):
                 'pk' : self.pk}
         return reverse('entry_detail', kwargs=kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_title = instance.__dict__.get('title')
+        return instance
+
     def save(self, *args, **kwargs):
-        self.slug = slugify(self.title)
+        if self.pk is None or self.title != getattr(self, '_loaded_title', None):
+            self.slug = slugify(self.title)
         super().save(*args, **kwargs)
+        self._loaded_title = self.title
 
 class Comment(models.Model):
-    entry = models.ForeignKey(Entry)
+    entry = models.ForeignKey(Entry, db_index=False)
     name = models.CharField(max_length=100)
     email = models.EmailField()
     body = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
-    modified_at = models.DateTimeField(auto_now_add=True, editable=False)
+    modified_at = models.DateTimeField(auto_now=True, editable=False)
 
     def __str__(self):
         return self.email
 
+    class Meta:
+        ordering = ['created_at']
+        index_together = [('entry', 'created_at')]
+
+    @cached_property
     def gravatar_url(self):
-        md5 = hashlib.md5(self.email.encode())
-        digest = md5 = md5.hexdigest()
+        md5 = hashlib.md5(self.email.strip().lower().encode())
+        digest = md5.hexdigest()
 
         return 'http://www.gravatar.com/avatar/{}'.format(digest)
\ No newline at end of file
@@ -1,16 +1,37 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.template import Template, Context
-from django.template.defaultfilters import slugify
+from django.utils import timezone
+from django.utils.text import slugify
+from django.views.generic.detail import SingleObjectMixin
 
 from django_webtest import WebTest
 
 import hashlib
 import datetime
+from unittest import mock
 
 from .forms import CommentForm
 from .models import Entry, Comment
 
+def bulk_insert_entries(author, titles):
+	"""Insert entries with a single executemany(), bypassing the ORM.
+
+	Each title is one second older than the one before it, so the first
+	title is the newest entry.
+	"""
+	field = Entry._meta.get_field('created_at')
+	now = timezone.now()
+	rows = []
+	for n, title in enumerate(titles):
+		created = field.get_db_prep_value(now - datetime.timedelta(seconds=n), connection)
+		rows.append((title, '', author.pk, created, created, slugify(title)))
+	sql = ("INSERT INTO {0} (title, body, author_id, created_at, modified_at, slug) "
+		"VALUES (%s, %s, %s, %s, %s, %s)").format(connection.ops.quote_name(Entry._meta.db_table))
+	with connection.cursor() as cursor:
+		cursor.executemany(sql, rows)
+
 class EntryModelTest(TestCase):
 
 	def test_string_representation(self):
@@ -25,6 +46,18 @@ class EntryModelTest(TestCase):
 		entry = Entry.objects.create(title="My entry title", author=user)
 		self.assertIsNotNone(entry.get_absolute_url())
 
+	def test_slug_follows_title(self):
+		user = get_user_model().objects.create(username="armin")
+		entry = Entry.objects.create(title="My entry title", author=user)
+		entry = Entry.objects.get(pk=entry.pk)
+		entry.body = "edited body"
+		entry.slug = "custom-slug"
+		entry.save()
+		self.assertEqual(Entry.objects.get(pk=entry.pk).slug, "custom-slug")
+		entry.title = "A new title"
+		entry.save()
+		self.assertEqual(Entry.objects.get(pk=entry.pk).slug, "a-new-title")
+
 
 class ProjectTests(TestCase):
 
@@ -37,8 +70,9 @@ class HomePageTests(TestCase):
 
     """Test whether our blog entries show up on the homepage"""
 
-    def setUp(self):
-        self.user = get_user_model().objects.create(username='some_user')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(username='some_user')
 
     def test_one_entry(self):
         Entry.objects.create(title='title', body='body', author=self.user)
@@ -58,37 +92,54 @@ class HomePageTests(TestCase):
 	    response = self.client.get('/')
 	    self.assertContains(response, 'No blog entries yet.')
 
+    def test_older_entries_paginated(self):
+        bulk_insert_entries(self.user, ['Post #{0}'.format(n) for n in range(11)])
+        response = self.client.get('/')
+        self.assertContains(response, 'Post #9')
+        self.assertNotContains(response, 'Post #10')
+        self.assertContains(response, '?page=2')
+        response = self.client.get('/?page=2')
+        self.assertContains(response, 'Post #10')
+
 class EntryViewTest(WebTest):
 
-	def setUp(self):
-		self.user = get_user_model().objects.create(username="armin")
-		self.entry = Entry.objects.create(title="title1", body="body1", author=self.user)
+	@classmethod
+	def setUpTestData(cls):
+		cls.user = get_user_model().objects.create(username="armin")
+		cls.entry = Entry.objects.create(title="title1", body="body1", author=cls.user)
 
 	def test_basic_view(self):
 		response = self.client.get(self.entry.get_absolute_url())
 		self.assertEqual(response.status_code, 200)
 
-	def test_title_in_entry(self):
+	def test_detail_contents(self):
+		comment = Comment.objects.create(entry=self.entry, body="this is a test comment.")
 		response = self.client.get(self.entry.get_absolute_url())
 		self.assertContains(response, self.entry.title)
-
-	def test_body_in_entry(self):
-		response = self.client.get(self.entry.get_absolute_url())
 		self.assertContains(response, self.entry.body)
-
-	def test_comment_in_entry(self):
-		self.comment = Comment.objects.create(entry=self.entry, body="this is a test comment.")
-		response = self.client.get(self.entry.get_absolute_url())
-		self.assertContains(response, self.comment.body)
+		self.assertContains(response, comment.body)
+
+	def test_entry_fetched_once(self):
+		get_object = SingleObjectMixin.get_object
+		with mock.patch.object(SingleObjectMixin, 'get_object', autospec=True,
+				side_effect=get_object) as patched:
+			self.client.get(self.entry.get_absolute_url())
+		self.assertEqual(patched.call_count, 1)
+
+	def test_detail_queries(self):
+		for n in range(3):
+			Comment.objects.create(entry=self.entry, body="comment #{0}".format(n))
+		# entry, its comments, and the entry_history sidebar
+		with self.assertNumQueries(3):
+			self.client.get(self.entry.get_absolute_url())
 
 	def test_view_page(self):
 		page = self.app.get(self.entry.get_absolute_url())
 		self.assertEqual(len(page.forms), 1)
 
 	def test_form_error(self):
-		page = self.app.get(self.entry.get_absolute_url())
-		page = page.form.submit()
-		self.assertContains(page, "This field is required.")
+		response = self.client.post(self.entry.get_absolute_url(), {})
+		self.assertContains(response, "This field is required.")
 
 	def test_form_success(self):
 		page = self.app.get(self.entry.get_absolute_url())
@@ -133,18 +184,31 @@ class CommentModelTest(TestCase):
 		comment = Comment(email="armin@gmail.com")
 		self.assertEqual(str(comment), "armin@gmail.com")
 
+	def test_modified_at_updates_on_save(self):
+		user = get_user_model().objects.create(username="armin")
+		entry = Entry.objects.create(author=user, title="Entry Title")
+		comment = Comment.objects.create(entry=entry, body="Comment Body")
+		earlier = timezone.now() - datetime.timedelta(days=1)
+		Comment.objects.filter(pk=comment.pk).update(created_at=earlier, modified_at=earlier)
+		comment = Comment.objects.get(pk=comment.pk)
+		comment.save()
+		comment = Comment.objects.get(pk=comment.pk)
+		self.assertEqual(comment.created_at, earlier)
+		self.assertGreater(comment.modified_at, earlier)
+
 	def test_gravatar_url(self):
-		email = "armin@gmail.com"
-		comment = Comment(body="Comment Body", email=email)
-		md5 = hashlib.md5(email.encode())
+		comment = Comment(body="Comment Body", email=" Armin@Gmail.com ")
+		md5 = hashlib.md5("armin@gmail.com".encode())
 		digest = md5.hexdigest()
 		expected = "http://www.gravatar.com/avatar/{}".format(digest)
+		self.assertEqual(comment.gravatar_url, expected)
 
 class CommentFormTest(TestCase):
 
-	def setUp(self):
+	@classmethod
+	def setUpTestData(cls):
 		user = get_user_model().objects.create_user('armin')
-		self.entry = Entry.objects.create(author=user, title="Entry Title")
+		cls.entry = Entry.objects.create(author=user, title="Entry Title")
 
 	def test_init(self):
 		CommentForm(entry=self.entry)
@@ -178,8 +242,9 @@ class CommentFormTest(TestCase):
 class EntryHistoryTagTest(TestCase):
 	TEMPLATE = Template("{% load blog_tags %} {% entry_history %}")
 
-	def setUp(self):
-		self.user = get_user_model().objects.create(username="armin")
+	@classmethod
+	def setUpTestData(cls):
+		cls.user = get_user_model().objects.create(username="armin")
 
 	def test_entry_shows_up(self):
 		entry = Entry.objects.create(author=self.user, title="My entry title")
@@ -190,10 +255,27 @@ class EntryHistoryTagTest(TestCase):
 		rendered = self.TEMPLATE.render(Context({}))
 		self.assertIn("No recent entries", rendered)
 
+	def test_posts_after_no_posts(self):
+		self.TEMPLATE.render(Context({}))
+		entry = Entry.objects.create(author=self.user, title="My entry title")
+		rendered = self.TEMPLATE.render(Context({}))
+		self.assertIn(entry.title, rendered)
+		self.assertNotIn("No recent entries", rendered)
+
 	def test_many_posts(self):
-		for n in range(6):
-			Entry.objects.create(author=self.user, title="Post #{0}".format(n))
+		titles = ["Post #{0}".format(n) for n in range(6)]
+		Entry.objects.bulk_create([
+			Entry(author=self.user, title=title, slug=slugify(title))
+			for title in titles
+		])
+		rendered = self.TEMPLATE.render(Context({}))
+		self.assertIn("Post #5", rendered)
+		self.assertNotIn("Post #6", rendered)
+
+	def test_newest_posts_shown(self):
+		bulk_insert_entries(self.user, ["Post #{0}".format(n) for n in range(7)])
 		rendered = self.TEMPLATE.render(Context({}))
+		self.assertIn("Post #0", rendered)
 		self.assertIn("Post #5", rendered)
 		self.assertNotIn("Post #6", rendered)
 
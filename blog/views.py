@@ -11,6 +11,11 @@ class EntryDetail(CreateView):
     template_name = 'blog/entry_detail.html'
     form_class = CommentForm
 
+    def get_object(self, queryset=None):
+    	if not hasattr(self, '_entry'):
+    		self._entry = super().get_object(queryset)
+    	return self._entry
+
     def get_form_kwargs(self):
     	kwargs = super().get_form_kwargs()
     	kwargs['entry'] = self.get_object() 
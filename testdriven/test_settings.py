@@ -0,0 +1,42 @@
+"""
+Django settings for running the testdriven test suite.
+
+Usage: python manage.py test --settings=testdriven.test_settings
+"""
+
+from .settings import *
+
+
+# Build the test database straight from the current models instead of
+# replaying every migration.
+# https://docs.djangoproject.com/en/1.9/ref/settings/#migration-modules
+
+class DisableMigrations(object):
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+MIGRATION_MODULES = DisableMigrations()
+
+
+# Cheap hasher for users created with a password in tests.
+# https://docs.djangoproject.com/en/1.9/topics/testing/overview/#password-hashing
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# Pin tests to SQLite, whose test database Django always builds in memory,
+# whatever backend the main settings use.
+# https://docs.djangoproject.com/en/1.9/ref/settings/#databases
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
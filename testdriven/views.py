@@ -8,4 +8,6 @@ class HomeView(ListView):
 
 	template_name = 'index.html'
 
-	queryset = Entry.objects.order_by('-created_at')
\ No newline at end of file
+	model = Entry
+
+	paginate_by = 10
\ No newline at end of file